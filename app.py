@@ -2,13 +2,80 @@
 # Web interface for Smart Resume Analyzer using Streamlit
 
 import streamlit as st
-import tempfile
-import os
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
 from parser import extract_text
-from extractor import extract_all
+from extractor import extract_all_batch
 from scorer import calculate_match_score, get_matching_keywords
 from suggester import get_resume_suggestions
 
+
+# ========================================
+# CACHED HELPERS
+# ========================================
+# Streamlit reruns this whole script on every click,
+# so repeat analyses of the same resume and job description are served from cache.
+# Arguments starting with "_" are not hashed by Streamlit - the short
+# content hash passed next to them is the cache key instead.
+
+def content_hash(data):
+    """
+    Makes a short fingerprint of file bytes or text, used as a cache key.
+    
+    Args:
+        data: Bytes or a string
+    
+    Returns:
+        Hex digest as a string
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@st.cache_resource
+def get_executor():
+    """
+    Thread pool shared by every rerun, used to build suggestions
+    in the background while the rest of the results are drawn.
+    """
+    return ThreadPoolExecutor(max_workers=2)
+
+
+@st.cache_data(show_spinner=False)
+def cached_extract_text(file_hash, file_name, _file_bytes):
+    """
+    Extracts text from an uploaded file, once per unique file.
+    """
+    # Read straight from memory - no temp file needed
+    return extract_text(io.BytesIO(_file_bytes), file_name)
+
+
+@st.cache_data(show_spinner=False)
+def cached_extract_all_batch(resume_hashes, _resume_texts, _resume_lowers):
+    """
+    Extracts candidate information, once per unique set of resumes.
+    """
+    return extract_all_batch(_resume_texts, _resume_lowers)
+
+
+@st.cache_data(show_spinner=False)
+def cached_match_score(resume_hash, jd_hash, _resume_text, _job_description, _resume_lower, _job_lower):
+    """
+    Calculates the match score, once per unique resume and job description.
+    """
+    return calculate_match_score(_resume_text, _job_description, _resume_lower, _job_lower)
+
+
+@st.cache_data(show_spinner=False)
+def cached_matching_keywords(resume_hash, jd_hash, _resume_text, _job_description, _resume_lower, _job_lower):
+    """
+    Finds matched and missing keywords, once per unique resume and job description.
+    """
+    return get_matching_keywords(_resume_text, _job_description, _resume_lower, _job_lower)
+
+
 # Configure the page
 st.set_page_config(
     page_title="Smart Resume Analyzer",
@@ -28,14 +95,15 @@ col1, col2 = st.columns(2)
 # Left column: Upload Resume
 with col1:
     st.header("📄 Step 1: Upload Resume")
-    uploaded_file = st.file_uploader(
-        "Choose a PDF or DOCX file",
+    uploaded_files = st.file_uploader(
+        "Choose PDF or DOCX files",
         type=["pdf", "docx"],
-        help="Upload the candidate's resume"
+        accept_multiple_files=True,
+        help="Upload one or more candidate resumes"
     )
     
-    if uploaded_file:
-        st.success(f"✅ File uploaded: {uploaded_file.name}")
+    if uploaded_files:
+        st.success(f"✅ {len(uploaded_files)} file(s) uploaded: {', '.join(f.name for f in uploaded_files)}")
 
 # Right column: Job Description
 with col2:
@@ -58,10 +126,120 @@ col_center = st.columns([1, 1, 1])
 with col_center[1]:
     analyze_button = st.button("🔍 Analyze Resume", type="primary", use_container_width=True)
 
+
+def show_results(file_name, resume_text, info, score, keywords, suggestions_future):
+    """
+    Shows the full analysis for one resume.
+    
+    Args:
+        file_name: Name of the uploaded resume file
+        resume_text: The complete resume text
+        info: Extracted candidate information
+        score: Match score from 0 to 100
+        keywords: Matched and missing keywords
+        suggestions_future: Future that will hold the suggestions text
+    """
+    # ========================================
+    # DISPLAY RESULTS
+    # ========================================
+    st.markdown("---")
+    st.header(f"📊 Analysis Results: {file_name}")
+    
+    # Match Score (big and prominent)
+    st.subheader("Overall Match Score")
+    
+    # Color-coded score display
+    if score >= 70:
+        st.success(f"# {score}%")
+        st.success("✅ **EXCELLENT MATCH!** This candidate is highly qualified for the position.")
+    elif score >= 50:
+        st.warning(f"# {score}%")
+        st.warning("⚠️ **GOOD MATCH!** Candidate meets most requirements but may need some upskilling.")
+    else:
+        st.error(f"# {score}%")
+        st.error("❌ **WEAK MATCH.** Candidate may need significant additional training or experience.")
+    
+    # Progress bar
+    st.progress(score / 100)
+    
+    st.markdown("---")
+    
+    # Two columns for skills breakdown
+    skill_col1, skill_col2 = st.columns(2)
+    
+    with skill_col1:
+        st.subheader("✅ Matching Skills")
+        if keywords['matched']:
+            for skill in keywords['matched']:
+                st.markdown(f"- ✅ {skill}")
+        else:
+            st.info("No matching skills found")
+        
+        st.metric(
+            "Skills Match", 
+            f"{keywords['match_count']}/{keywords['total_required']}",
+            f"{round(keywords['match_count']/keywords['total_required']*100) if keywords['total_required'] > 0 else 0}%"
+        )
+    
+    with skill_col2:
+        st.subheader("❌ Missing Skills")
+        if keywords['missing']:
+            for skill in keywords['missing']:
+                st.markdown(f"- ❌ {skill}")
+        else:
+            st.success("No missing skills!")
+    
+    st.markdown("---")
+    
+    # Candidate Information
+    st.subheader("👤 Candidate Information")
+    
+    info_col1, info_col2, info_col3 = st.columns(3)
+    
+    with info_col1:
+        st.metric("Name", info['name'])
+    
+    with info_col2:
+        st.metric("Email", info['email'])
+    
+    with info_col3:
+        st.metric("Phone", info['phone'])
+    
+    # All detected skills
+    with st.expander("📋 All Detected Skills in Resume"):
+        if info['skills']:
+            skills_text = ", ".join(info['skills'])
+            st.write(skills_text)
+            st.info(f"Total: {len(info['skills'])} skills detected")
+        else:
+            st.warning("No skills detected in resume")
+    
+    st.markdown("---")
+    
+    # ========================================
+    # AI SUGGESTIONS SECTION
+    # ========================================
+    st.header("🤖 AI-Powered Improvement Suggestions")
+    
+    # Started in the background before any results were drawn - wait for it here
+    with st.spinner("⚙️ Generating personalized suggestions..."):
+        suggestions = suggestions_future.result()
+    
+    # Display in a nice expandable box
+    with st.expander("📋 View Detailed Suggestions", expanded=True):
+        st.text(suggestions)
+    
+    st.markdown("---")
+    
+    # Raw resume text preview
+    with st.expander("📄 Resume Text Preview (First 1000 characters)"):
+        st.text(resume_text[:1000] + "..." if len(resume_text) > 1000 else resume_text)
+
+
 # Analysis section
 if analyze_button:
     # Validation
-    if uploaded_file is None:
+    if not uploaded_files:
         st.error("❌ Please upload a resume first!")
     elif job_description.strip() == "":
         st.error("❌ Please paste a job description!")
@@ -70,126 +248,62 @@ if analyze_button:
         with st.spinner("🔄 Analyzing resume... This may take a few seconds..."):
             
             try:
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp_file:
-                    tmp_file.write(uploaded_file.read())
-                    tmp_path = tmp_file.name
-                
-                # Extract text from resume
-                resume_text = extract_text(tmp_path)
-                
-                # Extract information
-                info = extract_all(resume_text)
+                jd_hash = content_hash(job_description)
+                job_lower = job_description.lower()
                 
-                # Calculate match score
-                score = calculate_match_score(resume_text, job_description)
-                
-                # Get keyword analysis
-                keywords = get_matching_keywords(resume_text, job_description)
-                
-                # Clean up temp file
-                os.unlink(tmp_path)
-                
-                # ========================================
-                # DISPLAY RESULTS
-                # ========================================
-                st.markdown("---")
-                st.header("📊 Analysis Results")
-                
-                # Match Score (big and prominent)
-                st.subheader("Overall Match Score")
-                
-                # Color-coded score display
-                if score >= 70:
-                    st.success(f"# {score}%")
-                    st.success("✅ **EXCELLENT MATCH!** This candidate is highly qualified for the position.")
-                elif score >= 50:
-                    st.warning(f"# {score}%")
-                    st.warning("⚠️ **GOOD MATCH!** Candidate meets most requirements but may need some upskilling.")
-                else:
-                    st.error(f"# {score}%")
-                    st.error("❌ **WEAK MATCH.** Candidate may need significant additional training or experience.")
-                
-                # Progress bar
-                st.progress(score / 100)
-                
-                st.markdown("---")
-                
-                # Two columns for skills breakdown
-                skill_col1, skill_col2 = st.columns(2)
-                
-                with skill_col1:
-                    st.subheader("✅ Matching Skills")
-                    if keywords['matched']:
-                        for skill in keywords['matched']:
-                            st.markdown(f"- ✅ {skill}")
-                    else:
-                        st.info("No matching skills found")
+                resume_texts = []
+                resume_hashes = []
+                for uploaded_file in uploaded_files:
+                    file_bytes = uploaded_file.getvalue()
+                    file_hash = content_hash(file_bytes)
                     
-                    st.metric(
-                        "Skills Match", 
-                        f"{keywords['match_count']}/{keywords['total_required']}",
-                        f"{round(keywords['match_count']/keywords['total_required']*100) if keywords['total_required'] > 0 else 0}%"
-                    )
-                
-                with skill_col2:
-                    st.subheader("❌ Missing Skills")
-                    if keywords['missing']:
-                        for skill in keywords['missing']:
-                            st.markdown(f"- ❌ {skill}")
-                    else:
-                        st.success("No missing skills!")
-                
-                st.markdown("---")
-                
-                # Candidate Information
-                st.subheader("👤 Candidate Information")
-                
-                info_col1, info_col2, info_col3 = st.columns(3)
-                
-                with info_col1:
-                    st.metric("Name", info['name'])
+                    # Extract text from resume
+                    resume_texts.append(cached_extract_text(file_hash, uploaded_file.name, file_bytes))
+                    resume_hashes.append(file_hash)
                 
-                with info_col2:
-                    st.metric("Email", info['email'])
+                # Lowercase each resume once and share it between extractor and scorer
+                resume_lowers = [resume_text.lower() for resume_text in resume_texts]
                 
-                with info_col3:
-                    st.metric("Phone", info['phone'])
+                # Extract information from all resumes in one batch
+                infos = cached_extract_all_batch(tuple(resume_hashes), resume_texts, resume_lowers)
                 
-                # All detected skills
-                with st.expander("📋 All Detected Skills in Resume"):
-                    if info['skills']:
-                        skills_text = ", ".join(info['skills'])
-                        st.write(skills_text)
-                        st.info(f"Total: {len(info['skills'])} skills detected")
-                    else:
-                        st.warning("No skills detected in resume")
-                
-                st.markdown("---")
-                
-                # ========================================
-                # AI SUGGESTIONS SECTION
-                # ========================================
-                st.header("🤖 AI-Powered Improvement Suggestions")
-                
-                with st.spinner("⚙️ Generating personalized suggestions..."):
-                    suggestions = get_resume_suggestions(
+                results = []
+                for uploaded_file, resume_hash, resume_text, resume_lower, info in zip(uploaded_files, resume_hashes, resume_texts, resume_lowers, infos):
+                    # Calculate match score
+                    score = cached_match_score(resume_hash, jd_hash, resume_text, job_description, resume_lower, job_lower)
+                    
+                    # Get keyword analysis
+                    keywords = cached_matching_keywords(resume_hash, jd_hash, resume_text, job_description, resume_lower, job_lower)
+                    
+                    # Start building suggestions now, while the results are being drawn
+                    suggestions_future = get_executor().submit(
+                        get_resume_suggestions,
                         resume_text,
                         job_description,
                         score,
                         keywords['matched'],
                         keywords['missing']
                     )
+                    
+                    results.append((uploaded_file.name, resume_text, info, score, keywords, suggestions_future))
                 
-                # Display in a nice expandable box
-                with st.expander("📋 View Detailed Suggestions", expanded=True):
-                    st.text(suggestions)
-                
-                st.markdown("---")
+                # Rank candidates when more than one resume was uploaded
+                if len(results) > 1:
+                    st.markdown("---")
+                    st.header("🏆 Candidate Ranking")
+                    ranked = sorted(results, key=lambda result: result[3], reverse=True)
+                    st.table([
+                        {
+                            "Resume": file_name,
+                            "Name": info['name'],
+                            "Match Score (%)": score,
+                            "Skills Matched": f"{keywords['match_count']}/{keywords['total_required']}",
+                        }
+                        for file_name, _, info, score, keywords, _ in ranked
+                    ])
                 
-                # Raw resume text preview
-                with st.expander("📄 Resume Text Preview (First 1000 characters)"):
-                    st.text(resume_text[:1000] + "..." if len(resume_text) > 1000 else resume_text)
+                for file_name, resume_text, info, score, keywords, suggestions_future in results:
+                    show_results(file_name, resume_text, info, score, keywords, suggestions_future)
                 
                 st.markdown("---")
                 st.success("✅ Analysis complete!")
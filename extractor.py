@@ -1,13 +1,16 @@
 # extractor.py
 # This file extracts specific information from resume text
 
+import logging
 import re
+from functools import lru_cache
 
-# spaCy disabled for deployment - using simple name extraction instead
-nlp = None
+import ahocorasick
 
-# List of common skills to look for in resumes
-SKILLS_LIST = [
+logger = logging.getLogger(__name__)
+
+# Common skills to look for in resumes (a tuple, since it never changes)
+SKILLS_LIST = (
     # Programming Languages
     "python", "java", "javascript", "c++", "c#", "php", "ruby", "swift",
     "kotlin", "go", "rust", "typescript", "r", "matlab", "scala",
@@ -36,7 +39,90 @@ SKILLS_LIST = [
     # Soft Skills
     "leadership", "communication", "teamwork", "problem solving",
     "project management", "analytical thinking"
-]
+)
+
+
+def build_automaton(words):
+    """
+    Builds an Aho-Corasick automaton that finds all of the given words
+    in a single pass over a text, instead of one scan per word.
+    
+    Args:
+        words: Lowercase words or phrases to look for
+    
+    Returns:
+        A ready-to-use ahocorasick.Automaton
+    """
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import so every resume reuses it
+SKILLS_AUTOMATON = build_automaton(SKILLS_LIST)
+
+# Patterns compiled once instead of on every call
+# Email format: something@something.com
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Various phone formats
+# Examples: (123) 456-7890, 123-456-7890, +91 1234567890
+PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)(\d{3}[-.\s]?\d{4})')
+
+# Both patterns in one, so extract_all finds email and phone in a single pass
+CONTACT_PATTERN = re.compile(
+    f"(?P<email>{EMAIL_PATTERN.pattern})|(?P<phone>{PHONE_PATTERN.pattern})"
+)
+
+# Common resume section headers - a line containing these is never the name
+NAME_SKIP_WORDS = ('resume', 'curriculum', 'vitae', 'cv', 'profile', 'summary')
+
+# A line that looks like a name: two to four capitalized words, no digits
+_NAME_LINE_RE = re.compile(r"[A-Z][A-Za-z.'-]*(?: [A-Z][A-Za-z.'-]*){1,3}")
+
+# How often the quick name check fails, logged so it can be tuned
+_name_stats = {"resumes": 0, "heuristic_misses": 0}
+
+# spaCy batch settings for extract_all_batch
+# Starting worker processes is slow, so only do it for big batches
+SPACY_BATCH_SIZE = 64
+SPACY_MULTIPROCESS_MIN_DOCS = 64
+
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """
+    Loads the spaCy model the first time a name needs it, then reuses it.
+    Only named entity recognition is needed, so the other pipes are switched off.
+    
+    spaCy is optional - the deployed app runs without it and falls back
+    to simple name extraction. It is imported here rather than at the top
+    so that importing this file stays fast.
+    
+    Returns:
+        The spaCy pipeline, or None if spaCy or the model is not installed
+    """
+    try:
+        import spacy
+    except ImportError:
+        return None
+    
+    try:
+        return spacy.load(
+            "en_core_web_sm",
+            disable=["tagger", "parser", "attribute_ruler", "lemmatizer"],
+        )
+    except OSError:
+        # Never download at runtime - that would block the first request.
+        # Say what is missing once (get_nlp is cached) and carry on without spaCy.
+        logger.warning(
+            "spaCy is installed but the en_core_web_sm model is not. "
+            "Install it with: python -m spacy download en_core_web_sm. "
+            "Falling back to simple name extraction."
+        )
+        return None
 
 
 def extract_email(text):
@@ -49,14 +135,11 @@ def extract_email(text):
     Returns:
         Email address as a string, or "Not found"
     """
-    # Pattern that matches email format: something@something.com
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
-    # Find all matches
-    matches = re.findall(pattern, text)
+    # Stop at the first email - that is the only one we use
+    match = EMAIL_PATTERN.search(text)
     
     # Return the first email found, or "Not found"
-    return matches[0] if matches else "Not found"
+    return match.group(0) if match else "Not found"
 
 
 def extract_phone(text):
@@ -69,94 +152,309 @@ def extract_phone(text):
     Returns:
         Phone number as a string, or "Not found"
     """
-    # Pattern that matches various phone formats
-    # Examples: (123) 456-7890, 123-456-7890, +91 1234567890
-    pattern = r'(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)(\d{3}[-.\s]?\d{4})'
+    # Stop at the first phone number - that is the only one we use
+    match = PHONE_PATTERN.search(text)
+    
+    return match.group(0) if match else "Not found"
+
+
+def extract_contact(text):
+    """
+    Finds the first email address and phone number in one pass over the text.
     
-    # Find all matches
-    matches = re.findall(pattern, text)
+    Args:
+        text: The resume text
     
-    if matches:
-        # Join the parts of the first match
-        phone = ''.join(matches[0])
-        return phone
-    else:
-        return "Not found"
+    Returns:
+        Dictionary with "email" and "phone", each a string or "Not found"
+    """
+    contact = {"email": "Not found", "phone": "Not found"}
+    
+    for match in CONTACT_PATTERN.finditer(text):
+        # lastgroup tells us which half of the pattern matched
+        kind = match.lastgroup
+        if contact[kind] == "Not found":
+            contact[kind] = match.group(kind)
+            
+            # Stop as soon as we have both
+            if "Not found" not in contact.values():
+                break
+    
+    return contact
 
 
-def extract_skills(text):
+def _is_whole_word(text_lower, start, end):
+    """
+    Checks that the match text_lower[start:end + 1] is not part of a bigger word.
+    Stops short skills like "go" or "r" matching inside "category" or "error".
+    
+    Args:
+        text_lower: The lowercased resume text
+        start: Index of the first character of the match
+        end: Index of the last character of the match
+    
+    Returns:
+        True if the match stands on its own, False otherwise
+    """
+    if start > 0 and text_lower[start - 1].isalnum():
+        return False
+    if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+        return False
+    return True
+
+
+def find_terms(automaton, text_lower, whole_words=True):
+    """
+    Finds which words of an automaton appear in the text.
+    
+    Args:
+        automaton: Automaton made by build_automaton
+        text_lower: The lowercased text to search
+        whole_words: Only count matches that are not part of a bigger word
+    
+    Returns:
+        Dictionary whose keys are the words found, in order of first appearance
+    """
+    # Walk the text once and keep every word found
+    # dict.fromkeys drops repeats but, unlike a set, keeps the order stable
+    return dict.fromkeys(
+        word
+        for end, word in automaton.iter(text_lower)
+        if not whole_words or _is_whole_word(text_lower, end - len(word) + 1, end)
+    )
+
+
+def extract_skills(text, text_lower=None):
     """
     Identifies which skills from our skills list appear in the resume.
     
     Args:
         text: The resume text
+        text_lower: text.lower(), if the caller already has it
     
     Returns:
-        List of skills found
+        List of skills found, in the order they appear in the resume
     """
     # Convert text to lowercase for case-insensitive matching
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Only count skills that appear as whole words
+    return list(find_terms(SKILLS_AUTOMATON, text_lower))
+
+
+def _is_section_header(line):
+    """
+    Checks if a line is a resume section header like "Curriculum Vitae".
+    
+    Args:
+        line: One line of the resume
+    
+    Returns:
+        True if the line contains one of NAME_SKIP_WORDS
+    """
+    line_lower = line.lower()
+    return any(skip in line_lower for skip in NAME_SKIP_WORDS)
+
+
+def _name_from_heading(text):
+    """
+    Quick name check - looks for a name-shaped line in the first 3 lines.
+    
+    Args:
+        text: The resume text
+    
+    Returns:
+        Name as a string, or None
+    """
+    for line in text.strip().split('\n')[:3]:
+        # Collapse repeated spaces/tabs so "John   Smith" still matches
+        line = " ".join(line.split())
+        if _NAME_LINE_RE.fullmatch(line) and not _is_section_header(line):
+            return line
+    
+    return None
+
+
+def _name_from_spacy(text):
+    """
+    Slower name check - asks spaCy for a PERSON entity.
+    
+    Args:
+        text: The resume text
+    
+    Returns:
+        Name as a string, or None if spaCy is missing or finds nothing
+    """
+    nlp = get_nlp()
+    if nlp is None:
+        return None
+    
+    # The name is always near the top, so only look at the start
+    return _first_person(nlp(text[:500]))
+
+
+def _first_person(doc):
+    """
+    Finds the first PERSON entity in a spaCy document.
+    
+    Args:
+        doc: A processed spaCy document
+    
+    Returns:
+        Name as a string, or None
+    """
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            return ent.text.strip()
+    
+    return None
+
+
+def _name_from_first_line(text):
+    """
+    Last resort - takes first meaningful line (usually the name).
     
-    # Find which skills from our list appear in the text
-    found_skills = []
-    for skill in SKILLS_LIST:
-        if skill in text_lower:
-            found_skills.append(skill)
+    Args:
+        text: The resume text
     
-    # Remove duplicates and return
-    return list(set(found_skills))
+    Returns:
+        Name as a string, or None
+    """
+    lines = text.strip().split('\n')
+    
+    # Get first non-empty line that looks like a name
+    for line in lines[:5]:  # Check first 5 lines
+        line = line.strip()
+        # Name should be short, not have numbers, and not be empty
+        if line and len(line) < 50 and not any(char.isdigit() for char in line):
+            if not _is_section_header(line):
+                return line
+    
+    return None
 
 
-def extract_name(text):
+def _record_name_lookup(heuristic_hit):
+    """
+    Counts how often the quick name check misses and logs the miss rate.
+    
+    Args:
+        heuristic_hit: True if _name_from_heading found a name
+    """
+    _name_stats["resumes"] += 1
+    if not heuristic_hit:
+        _name_stats["heuristic_misses"] += 1
+        logger.info(
+            "Name heuristic missed %d of %d resumes",
+            _name_stats["heuristic_misses"],
+            _name_stats["resumes"],
+        )
+
+
+def extract_name(text, use_spacy_fallback=True):
     """
     Attempts to extract the person's name from the resume.
-    Simple approach - takes first meaningful line (usually the name)
+    Tries a quick check on the first lines, only asks spaCy
+    when that fails, and finally takes the first meaningful line.
     
     Args:
         text: The resume text
+        use_spacy_fallback: Whether to use spaCy when the quick check fails
     
     Returns:
         Name as a string, or "Not found"
     """
-    # Simple approach: name is usually the first line
-    lines = text.strip().split('\n')
+    name = _name_from_heading(text)
+    _record_name_lookup(name is not None)
     
-    if lines:
-        # Get first non-empty line that looks like a name
-        for line in lines[:5]:  # Check first 5 lines
-            line = line.strip()
-            # Name should be short, not have numbers, and not be empty
-            if line and len(line) < 50 and not any(char.isdigit() for char in line):
-                # Skip common resume section headers
-                skip_words = ['resume', 'curriculum', 'vitae', 'cv', 'profile', 'summary']
-                if not any(skip in line.lower() for skip in skip_words):
-                    return line
+    if name is None and use_spacy_fallback:
+        name = _name_from_spacy(text)
     
-    return "Not found"
+    if name is None:
+        name = _name_from_first_line(text)
+    
+    return name if name else "Not found"
 
 
-def extract_all(text):
+def extract_all(text, text_lower=None):
     """
     Extracts all information from resume text.
     
     Args:
         text: The complete resume text
+        text_lower: text.lower(), if the caller already has it
     
     Returns:
         Dictionary with all extracted information
     """
     print("Extracting information from resume...")
     
+    contact = extract_contact(text)
+    
     extracted_info = {
         "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "skills": extract_skills(text),
+        "email": contact["email"],
+        "phone": contact["phone"],
+        "skills": extract_skills(text, text_lower),
     }
     
     return extracted_info
 
 
+def extract_all_batch(texts, texts_lower=None, use_spacy_fallback=True):
+    """
+    Extracts all information from many resumes at once.
+    Resumes where the quick name check fails are sent to spaCy
+    together with nlp.pipe, which is much faster than one at a time.
+    
+    Args:
+        texts: List of complete resume texts
+        texts_lower: The same texts lowercased, if the caller already has them
+        use_spacy_fallback: Whether to use spaCy when the quick check fails
+    
+    Returns:
+        List of dictionaries with all extracted information, in the same order
+    """
+    print(f"Extracting information from {len(texts)} resumes...")
+    
+    # Quick name check first
+    names = [_name_from_heading(text) for text in texts]
+    for name in names:
+        _record_name_lookup(name is not None)
+    
+    # Send only the misses through spaCy, in one batch
+    nlp = get_nlp() if use_spacy_fallback else None
+    pending = [i for i, name in enumerate(names) if name is None]
+    if nlp is not None and pending:
+        n_process = -1 if len(pending) >= SPACY_MULTIPROCESS_MIN_DOCS else 1
+        docs = nlp.pipe(
+            (texts[i][:500] for i in pending),
+            batch_size=SPACY_BATCH_SIZE,
+            n_process=n_process,
+        )
+        for i, doc in zip(pending, docs):
+            names[i] = _first_person(doc)
+    
+    if texts_lower is None:
+        texts_lower = [text.lower() for text in texts]
+    
+    results = []
+    for text, text_lower, name in zip(texts, texts_lower, names):
+        if name is None:
+            name = _name_from_first_line(text)
+        
+        contact = extract_contact(text)
+        
+        results.append({
+            "name": name if name else "Not found",
+            "email": contact["email"],
+            "phone": contact["phone"],
+            "skills": extract_skills(text, text_lower),
+        })
+    
+    return results
+
+
 # Test code - runs when you execute this file directly
 if __name__ == "__main__":
     # Import parser to read the resume
@@ -1,29 +1,88 @@
 # parser.py
 # This file reads PDF and DOCX files and extracts all text
 
+import os
+
 import pdfplumber
+import pypdfium2 as pdfium
 from docx import Document
 
 def extract_text_from_pdf(file_path):
     """
     Opens a PDF file and reads all text from it.
+    Uses PDFium (a fast C++ engine) and falls back to pdfplumber
+    when PDFium fails or finds no text.
+    
+    Args:
+        file_path: The path to your PDF file (like "sample_resume.pdf"),
+                   or an open file object such as io.BytesIO
+    
+    Returns:
+        All the text from the PDF as one big string
+    """
+    try:
+        text = _extract_text_with_pdfium(file_path)
+    except pdfium.PdfiumError:
+        text = ""
+    
+    if text.strip():
+        return text
+    
+    # PDFium already read the file object, so go back to the start
+    if hasattr(file_path, "seek"):
+        file_path.seek(0)
+    
+    return _extract_text_with_pdfplumber(file_path)
+
+
+def _extract_text_with_pdfium(file_path):
+    """
+    Reads all text from a PDF with PDFium.
     
     Args:
-        file_path: The path to your PDF file (like "sample_resume.pdf")
+        file_path: Path to the PDF file, or an open file object
     
     Returns:
         All the text from the PDF as one big string
     """
-    text = ""
+    texts = []
+    
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium ends lines with "\r\n" - use plain "\n" like the rest of the app
+            texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    
+    return "\n".join(texts)
+
+
+def _extract_text_with_pdfplumber(file_path):
+    """
+    Reads all text from a PDF with pdfplumber (slower, used as a fallback).
+    
+    Args:
+        file_path: Path to the PDF file, or an open file object
+    
+    Returns:
+        All the text from the PDF as one big string
+    """
+    texts = []
     
     # Open the PDF file
     with pdfplumber.open(file_path) as pdf:
-        # Go through each page
+        # Go through each page (scanned pages have no text)
         for page in pdf.pages:
-            # Extract text from this page and add it
-            text += page.extract_text() + "\n"
+            texts.append(page.extract_text() or "")
+            
+            # Free this page's parsed layout before reading the next one
+            page.close()
     
-    return text
+    return "\n".join(texts)
 
 
 def extract_text_from_docx(file_path):
@@ -31,38 +90,50 @@ def extract_text_from_docx(file_path):
     Opens a Word document and reads all text from it.
     
     Args:
-        file_path: The path to your DOCX file
+        file_path: The path to your DOCX file, or an open file object
     
     Returns:
         All the text from the document
     """
     doc = Document(file_path)
-    text = ""
     
-    # Go through each paragraph in the document
-    for paragraph in doc.paragraphs:
-        text += paragraph.text + "\n"
-    
-    return text
+    # Join every paragraph in the document in one go
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
 
+# Which function reads which file type
+_EXTRACTORS = {
+    ".pdf": extract_text_from_pdf,
+    ".docx": extract_text_from_docx,
+}
 
-def extract_text(file_path):
+
+def extract_text(file_path, file_name=None):
     """
     Smart function that detects if the file is PDF or DOCX
     and calls the correct function.
     
     Args:
-        file_path: Path to the resume file
+        file_path: Path to the resume file, or an open file object
+        file_name: Original file name, used to detect the type
+                   when file_path is a file object
     
     Returns:
         All text from the file
+    
+    Raises:
+        ValueError: If the file is not a .pdf or .docx
     """
-    if file_path.endswith(".pdf"):
-        return extract_text_from_pdf(file_path)
-    elif file_path.endswith(".docx"):
-        return extract_text_from_docx(file_path)
-    else:
-        return "ERROR: File must be .pdf or .docx"
+    name = file_name if file_name is not None else file_path
+    
+    # Lowercase the extension so "Resume.PDF" works too
+    suffix = os.path.splitext(name)[1].lower()
+    read_file = _EXTRACTORS.get(suffix)
+    
+    if read_file is None:
+        raise ValueError(f"File must be .pdf or .docx, got: {name}")
+    
+    return read_file(file_path)
 
 
 # Test code - runs when you execute this file directly
@@ -1,42 +1,94 @@
 # scorer.py
 # This file compares a resume with a job description and gives a match score
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import re
 
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
 
-def calculate_match_score(resume_text, job_description):
+from extractor import build_automaton, find_terms
+
+
+# One shared vectorizer for every request
+# Hashing needs no fitting, so the same object can be reused safely
+# Rows come out L2-normalized, so a plain dot product is the cosine similarity
+# float32 is plenty for a score rounded to 2 decimals and halves the memory
+# Texts are lowercased before they get here, so the vectorizer doesn't redo it
+_VEC = HashingVectorizer(
+    n_features=2**18,
+    ngram_range=(1, 2),
+    stop_words="english",
+    lowercase=False,
+    alternate_sign=False,
+    norm="l2",
+    dtype=np.float32,
+)
+
+# Quick word-overlap check done before the vectorizer
+# Words of 3+ characters, keeping tech spellings like "c++" and "node.js"
+_WORD_PATTERN = re.compile(r"[a-z0-9+#.]{3,}")
+
+# Below this share of common words the texts are clearly unrelated,
+# so the overlap itself is used as the score
+JACCARD_SHORTCUT = 0.02
+
+# Common important keywords to look for (a tuple, since it never changes)
+IMPORTANT_KEYWORDS = (
+    "python", "java", "javascript", "react", "angular", "vue",
+    "django", "flask", "spring", "nodejs", "sql", "nosql",
+    "aws", "azure", "docker", "kubernetes", "git", "agile",
+    "machine learning", "data analysis", "api", "microservices",
+    "leadership", "communication", "teamwork", "problem solving"
+)
+
+# Built once at import, so each text is scanned for every keyword in one pass
+KEYWORDS_AUTOMATON = build_automaton(IMPORTANT_KEYWORDS)
+
+
+def calculate_match_score(resume_text, job_description, resume_lower=None, job_lower=None):
     """
     Compares resume text with job description and calculates similarity.
     
     How it works:
-    1. Converts both texts into numerical vectors (lists of numbers)
-    2. Uses TF-IDF (Term Frequency-Inverse Document Frequency) algorithm
-    3. Calculates cosine similarity (mathematical measure of similarity)
-    4. Returns a percentage score
+    1. Checks how many words the two texts share (Jaccard overlap) -
+       if almost none, that overlap is the score and we stop here
+    2. Converts both texts into numerical vectors (lists of numbers)
+    3. Uses feature hashing on words and word pairs (no vocabulary to learn)
+    4. Calculates cosine similarity (mathematical measure of similarity)
+    5. Returns a percentage score
     
     Args:
         resume_text: The complete text from the resume
         job_description: The job posting text
+        resume_lower: resume_text.lower(), if the caller already has it
+        job_lower: job_description.lower(), if the caller already has it
     
     Returns:
         A score from 0 to 100 (percentage match)
     """
     
-    # TF-IDF Vectorizer converts text to numbers
-    # It measures how important each word is
-    vectorizer = TfidfVectorizer()
+    # Convert to lowercase for comparison
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+    if job_lower is None:
+        job_lower = job_description.lower()
+    
+    # Share of words the two texts have in common
+    resume_words = set(_WORD_PATTERN.findall(resume_lower))
+    job_words = set(_WORD_PATTERN.findall(job_lower))
+    overlap = len(resume_words & job_words) / max(1, len(resume_words | job_words))
     
-    # Combine both texts so the vectorizer learns all words
-    documents = [resume_text, job_description]
+    # Clearly a weak match - skip the vectorizer
+    if overlap < JACCARD_SHORTCUT:
+        return round(overlap * 100, 2)
     
-    # Convert texts to numerical vectors
-    tfidf_matrix = vectorizer.fit_transform(documents)
+    # Convert both texts to numerical vectors in one go
+    vectors = _VEC.transform([resume_lower, job_lower])
     
     # Calculate cosine similarity
-    # This measures the angle between two vectors
+    # Both rows are already normalized, so this is just their dot product
     # Result: 0.0 (completely different) to 1.0 (identical)
-    similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+    similarity = float(vectors[0].multiply(vectors[1]).sum())
     
     # Convert to percentage (0-100)
     score = round(similarity * 100, 2)
@@ -44,37 +96,37 @@ def calculate_match_score(resume_text, job_description):
     return score
 
 
-def get_matching_keywords(resume_text, job_description):
+def get_matching_keywords(resume_text, job_description, resume_lower=None, job_lower=None):
     """
     Finds which important keywords from the job description appear in the resume.
     
     Args:
         resume_text: The complete resume text
         job_description: The job posting text
+        resume_lower: resume_text.lower(), if the caller already has it
+        job_lower: job_description.lower(), if the caller already has it
     
     Returns:
         Dictionary with matched and missing keywords
     """
     
     # Convert to lowercase for comparison
-    resume_lower = resume_text.lower()
-    job_lower = job_description.lower()
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+    if job_lower is None:
+        job_lower = job_description.lower()
     
-    # Common important keywords to look for
-    important_keywords = [
-        "python", "java", "javascript", "react", "angular", "vue",
-        "django", "flask", "spring", "nodejs", "sql", "nosql",
-        "aws", "azure", "docker", "kubernetes", "git", "agile",
-        "machine learning", "data analysis", "api", "microservices",
-        "leadership", "communication", "teamwork", "problem solving"
-    ]
+    # One pass over each text finds every keyword it contains
+    # Plain substring matching, so "api" still counts inside "APIs"
+    resume_hits = find_terms(KEYWORDS_AUTOMATON, resume_lower, whole_words=False)
+    job_hits = find_terms(KEYWORDS_AUTOMATON, job_lower, whole_words=False)
     
-    # Find which keywords are in the job description
-    job_keywords = [kw for kw in important_keywords if kw in job_lower]
+    # Keywords in the job description, kept in IMPORTANT_KEYWORDS order
+    job_keywords = [kw for kw in IMPORTANT_KEYWORDS if kw in job_hits]
     
     # Check which of those are also in the resume
-    matched = [kw for kw in job_keywords if kw in resume_lower]
-    missing = [kw for kw in job_keywords if kw not in resume_lower]
+    matched = [kw for kw in job_keywords if kw in resume_hits]
+    missing = [kw for kw in job_keywords if kw not in resume_hits]
     
     return {
         "matched": matched,
@@ -1,87 +1,222 @@
 # suggester.py
 # Free Resume Suggestion Engine (No API Required)
 
+import sys
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+
+# =====================================================
+# Overall assessment texts
+# =====================================================
+# Interned so any later equality check or caching on them is a pointer compare
+STRONG_ASSESSMENT = sys.intern(
+    "Strong alignment with the job requirements. "
+    "The candidate demonstrates solid technical compatibility and relevant experience."
+)
+MODERATE_ASSESSMENT = sys.intern(
+    "Moderate alignment with the job description. "
+    "Some important skills are present, but improvements are needed."
+)
+LOW_ASSESSMENT = sys.intern(
+    "Low alignment with the job description. "
+    "Several key skills and experiences are missing."
+)
+
+# Assessment for each 25-point band of the score:
+# 0-24 and 25-49 are low, 50-74 moderate, 75-99 and 100 strong
+_ASSESSMENTS = (
+    LOW_ASSESSMENT,
+    LOW_ASSESSMENT,
+    MODERATE_ASSESSMENT,
+    STRONG_ASSESSMENT,
+    STRONG_ASSESSMENT,
+)
+
+# At most this many missing skills get their own bullet - the rest are counted
+MAX_MISSING_SHOWN = 10
+
+# Bullet formats, applied with map() so the loop over skills runs in C
+_STRENGTH_BULLET = "• Demonstrated experience in %s".__mod__
+_IMPROVEMENT_BULLET = "• Consider adding practical experience with %s".__mod__
+
+# =====================================================
+# Fixed blocks, the same for every candidate
+# =====================================================
+# Joined once at import, so each call just reuses the finished strings
+_STATIC_RECOMMENDATIONS = "\n".join([
+    "\n========== SPECIFIC RECOMMENDATIONS ==========",
+    "• Add measurable achievements (e.g., improved efficiency by 30%).",
+    "• Include more technical details about your projects.",
+    "• Align resume keywords exactly with job description keywords.",
+    "• Highlight frameworks, tools, and technologies clearly.",
+    "• Add GitHub, portfolio, or live project links.",
+])
+
+_STATIC_REWRITES = "\n".join([
+    "\n========== RESUME REWRITE SUGGESTIONS ==========",
+    "\nBefore: Worked on a web development project.",
+    "After: Developed a scalable web application using Python and Flask, "
+    "reducing server response time by 40% and improving user experience.",
+    "\nBefore: Responsible for database management.",
+    "After: Designed and optimized SQL database schemas, "
+    "improving query performance by 35%.",
+])
+
+# Appended after formatting, so braces in the fixed text can never break format_map
+_STATIC_TAIL = f"\n{_STATIC_RECOMMENDATIONS}\n{_STATIC_REWRITES}"
+
+# =====================================================
+# Output template
+# =====================================================
+# Only the parts that change per candidate - each call fills in the placeholders
+_TEMPLATE = (
+    "========== OVERALL ASSESSMENT ==========\n"
+    "{assessment}\n"
+    "\n========== KEY STRENGTHS ==========\n"
+    "{strengths}\n"
+    "\n========== AREAS FOR IMPROVEMENT ==========\n"
+    "{improvements}"
+)
+
+
 def get_resume_suggestions(resume_text, job_description, match_score, matched_skills, missing_skills):
     """
     Generates intelligent resume improvement suggestions
     without using any external API.
+    
+    Results are cached, so re-scoring the same candidate is a dictionary lookup.
+    """
+
+    # The output only depends on the score band and the skills shown,
+    # so that is all the cache key needs (resume_text and job_description
+    # are not used in the suggestions)
+    return _build_suggestions(
+        score_band(match_score),
+        tuple(sys.intern(skill) for skill in matched_skills[:5]),
+        tuple(sys.intern(skill) for skill in islice(missing_skills, MAX_MISSING_SHOWN)),
+        max(0, len(missing_skills) - MAX_MISSING_SHOWN),
+    )
+
+
+def get_resume_suggestions_batch(match_scores, matched_skills_lists, missing_skills_lists):
+    """
+    Generates suggestions for many candidates at once,
+    e.g. every resume scored against the same job description.
+    
+    Args:
+        match_scores: Match scores (0 to 100), one per candidate - a list or numpy array
+        matched_skills_lists: List of matched skills lists, one per candidate
+        missing_skills_lists: List of missing skills lists, one per candidate
+    
+    Returns:
+        List of suggestion strings, in the same order as the inputs
+    """
+    # Work out every candidate's score band in one numpy step
+    # (same rule as score_band, without a Python call per candidate)
+    scores = np.asarray(match_scores, dtype=np.float64)
+    bands = np.clip(scores // 25, 0, 4).astype(np.intp).tolist()
+    
+    # Local names save a global lookup on every loop step
+    build = _build_suggestions
+    intern = sys.intern
+    
+    return [
+        build(
+            band,
+            tuple(intern(skill) for skill in matched_skills[:5]),
+            tuple(intern(skill) for skill in islice(missing_skills, MAX_MISSING_SHOWN)),
+            max(0, len(missing_skills) - MAX_MISSING_SHOWN),
+        )
+        for band, matched_skills, missing_skills
+        in zip(bands, matched_skills_lists, missing_skills_lists)
+    ]
+
+
+def score_band(match_score):
     """
+    Turns a 0-100 match score into an index into _ASSESSMENTS.
+    
+    Args:
+        match_score: Match score from 0 to 100
+    
+    Returns:
+        Band number from 0 to 4
+    """
+    # One division instead of a chain of comparisons
+    # (clamped, so scores below 0 or above 100 still land in a band)
+    return max(0, min(int(match_score // 25), 4))
+
 
-    suggestions = []
+@lru_cache(maxsize=512)
+def _build_suggestions(band, matched_skills, missing_skills, more_missing=0):
+    """
+    Builds the suggestions text. Cached on its (hashable) arguments.
+    
+    Args:
+        band: Score band from score_band
+        matched_skills: Tuple of up to 5 matched skills
+        missing_skills: Tuple of up to MAX_MISSING_SHOWN missing skills
+        more_missing: How many more missing skills were left out
+    
+    Returns:
+        The suggestions as one string
+    """
 
     # =====================================================
     # 1. Overall Assessment
     # =====================================================
-    if match_score >= 75:
-        assessment = (
-            "Strong alignment with the job requirements. "
-            "The candidate demonstrates solid technical compatibility and relevant experience."
-        )
-    elif match_score >= 50:
-        assessment = (
-            "Moderate alignment with the job description. "
-            "Some important skills are present, but improvements are needed."
-        )
-    else:
-        assessment = (
-            "Low alignment with the job description. "
-            "Several key skills and experiences are missing."
-        )
-
-    suggestions.append("========== OVERALL ASSESSMENT ==========")
-    suggestions.append(assessment)
+    assessment = _ASSESSMENTS[band]
 
     # =====================================================
     # 2. Key Strengths
     # =====================================================
-    suggestions.append("\n========== KEY STRENGTHS ==========")
-
     if matched_skills:
-        for skill in matched_skills[:5]:
-            suggestions.append(f"• Demonstrated experience in {skill}")
+        strengths = "\n".join(map(_STRENGTH_BULLET, matched_skills))
     else:
-        suggestions.append("• No strong skill matches identified.")
+        strengths = "• No strong skill matches identified."
 
     # =====================================================
     # 3. Areas for Improvement
     # =====================================================
-    suggestions.append("\n========== AREAS FOR IMPROVEMENT ==========")
-
     if missing_skills:
-        for skill in missing_skills:
-            suggestions.append(f"• Consider adding practical experience with {skill}")
+        improvements = "\n".join(map(_IMPROVEMENT_BULLET, missing_skills))
+        
+        # One summary line instead of a bullet for every remaining skill
+        if more_missing:
+            improvements += f"\n• ...and {more_missing} more missing skills"
     else:
-        suggestions.append("• Resume already covers most required skills.")
+        improvements = "• Resume already covers most required skills."
 
     # =====================================================
-    # 4. Specific Recommendations
+    # 4 & 5. Specific Recommendations and Resume Rewrite Suggestions
     # =====================================================
-    suggestions.append("\n========== SPECIFIC RECOMMENDATIONS ==========")
+    return _TEMPLATE.format_map({
+        "assessment": assessment,
+        "strengths": strengths,
+        "improvements": improvements,
+    }) + _STATIC_TAIL
 
-    suggestions.append("• Add measurable achievements (e.g., improved efficiency by 30%).")
-    suggestions.append("• Include more technical details about your projects.")
-    suggestions.append("• Align resume keywords exactly with job description keywords.")
-    suggestions.append("• Highlight frameworks, tools, and technologies clearly.")
-    suggestions.append("• Add GitHub, portfolio, or live project links.")
 
-    # =====================================================
-    # 5. Resume Rewrite Suggestions
-    # =====================================================
-    suggestions.append("\n========== RESUME REWRITE SUGGESTIONS ==========")
-
-    suggestions.append("\nBefore: Worked on a web development project.")
-    suggestions.append(
-        "After: Developed a scalable web application using Python and Flask, "
-        "reducing server response time by 40% and improving user experience."
-    )
-
-    suggestions.append("\nBefore: Responsible for database management.")
-    suggestions.append(
-        "After: Designed and optimized SQL database schemas, "
-        "improving query performance by 35%."
-    )
-
-    return "\n".join(suggestions)
+def warmup():
+    """
+    Does all one-time setup up front, so the first real request doesn't pay for it.
+    
+    Long-running services (a web app, an API) should call this once at startup.
+    Nothing heavy runs just from importing this file - the test code below
+    only runs when the file is executed directly.
+    """
+    # Importing these loads the PDF/DOCX readers and builds the scorer's
+    # compiled patterns, keyword automaton and vectorizer
+    import parser  # noqa: F401
+    from scorer import calculate_match_score, get_matching_keywords
+    
+    # Run each step once on a tiny example so any lazy setup happens now
+    sample = "Python developer with SQL and Docker experience"
+    score = calculate_match_score(sample, sample)
+    keywords = get_matching_keywords(sample, sample)
+    get_resume_suggestions(sample, sample, score, keywords['matched'], keywords['missing'])
 
 
 # ==============================